@@ -2,8 +2,20 @@
 Validator module for the Paper Mario Randomizer plandomizer file.
 """
 
+import os
 import re
+import copy
 import json
+from functools import lru_cache
+from itertools import repeat
+from collections import Counter
+from typing import Callable, Iterable
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 from .plando_metadata import (
     allowed_locations,
@@ -38,46 +50,353 @@ TOPLEVEL_FIELD_REQUIRED_SPIRITS = "required_spirits"
 TOPLEVEL_FIELD_ITEMS = "items"
 TOPLEVEL_FIELD_DUNGEON_ENTRANCES = "dungeon_entrances"
 
+# dict[chapter_key, chapter], shared by all chapter based fields
+_CHAPTER_KEY_TO_INT: dict[str, int] = {
+    "chapter 1": 1,
+    "chapter 2": 2,
+    "chapter 3": 3,
+    "chapter 4": 4,
+    "chapter 5": 5,
+    "chapter 6": 6,
+    "chapter 7": 7,
+}
+_CHAPTER_KEYS_REPR: str = repr(list(_CHAPTER_KEY_TO_INT))
+
+_DIFF_ALLOWED_VALUES: frozenset[int] = frozenset(range(1, 9))
+_DIFF_STARTING_CHAPTERS: frozenset[str] = frozenset({
+    "chapter 1",
+    "chapter 2",
+    "chapter 5",
+})
+_DIFF_ALLOWED_VALUES_REPR: str = repr(sorted(_DIFF_ALLOWED_VALUES))
+
+# dict[boss_name, boss_index], in order of their vanilla chapters
+_BOSS_VALUE_TO_INDEX: dict[str, int] = {
+    "KoopaBros": 1,
+    "Tutankoopa": 2,
+    "TubbasHeart": 3,
+    "GeneralGuy": 4,
+    "LavaPiranha": 5,
+    "HuffNPuff": 6,
+    "CrystalKing": 7,
+}
+_BOSS_ALLOWED_VALUES_REPR: str = repr(list(_BOSS_VALUE_TO_INDEX))
+
+_MOVE_COSTS_TOPLEVEL_KEYS: frozenset[str] = frozenset({
+    "badge",
+    "partner",
+    "starpower",
+})
+_MOVE_COSTS_TOPLEVEL_KEYS_REPR: str = repr(sorted(_MOVE_COSTS_TOPLEVEL_KEYS))
+
+_ALLOWED_BADGE_KEYS: dict[str, frozenset[str]] = {
+    name: frozenset(cost_types) for name, cost_types in {
+        "AllorNothing": ("BP",),
+        "AutoJump": ("BP","FP"),
+        "AutoSmash": ("BP","FP"),
+        "Autobounce": ("BP","FP"),
+        "Berserker": ("BP",),
+        "BumpAttack": ("BP",),
+        "ChillOut": ("BP",),
+        "CloseCall": ("BP",),
+        "CrazyHeart": ("BP",),
+        "DDownJump": ("BP","FP"),
+        "DDownPound": ("BP","FP"),
+        "DamageDodge": ("BP",),
+        "DeepFocus": ("BP",),
+        "DefendPlus": ("BP",),
+        "DizzyAttack": ("BP",),
+        "DizzyStomp": ("BP","FP"),
+        "DodgeMaster": ("BP",),
+        "DoubleDip": ("BP","FP"),
+        "FPPlus": ("BP",),
+        "FeelingFine": ("BP",),
+        "FireShield": ("BP",),
+        "FirstAttack": ("BP",),
+        "FlowerFanatic": ("BP",),
+        "FlowerFinder": ("BP",),
+        "FlowerSaver": ("BP",),
+        "GroupFocus": ("BP",),
+        "HPDrain": ("BP",),
+        "HPPlus": ("BP",),
+        "HammerThrow": ("BP","FP"),
+        "HappyFlower": ("BP",),
+        "HappyHeart": ("BP",),
+        "HealthyHealthy": ("BP",),
+        "HeartFinder": ("BP",),
+        "ISpy": ("BP",),
+        "IcePower": ("BP",),
+        "JumpCharge": ("BP","FP"),
+        "LastStand": ("BP",),
+        "LuckyDay": ("BP",),
+        "MegaHPDrain": ("BP",),
+        "MegaJump": ("BP","FP"),
+        "MegaQuake": ("BP","FP"),
+        "MegaRush": ("BP",),
+        "MegaSmash": ("BP","FP"),
+        "MiniJumpCharge": ("BP","FP"),
+        "MiniSmashCharge": ("BP","FP"),
+        "MoneyMoney": ("BP",),
+        "Multibounce": ("BP","FP"),
+        "PDownDUp": ("BP",),
+        "PUpDDown": ("BP",),
+        "PayOff": ("BP",),
+        "Peekaboo": ("BP",),
+        "PowerBounce": ("BP","FP"),
+        "PowerJump": ("BP","FP"),
+        "PowerPlus": ("BP",),
+        "PowerQuake": ("BP","FP"),
+        "PowerRush": ("BP",),
+        "PowerSmash": ("BP","FP"),
+        "PrettyLucky": ("BP",),
+        "QuakeBounce": ("BP","FP"),
+        "QuakeHammer": ("BP","FP"),
+        "QuickChange": ("BP",),
+        "Refund": ("BP",),
+        "RightOn": ("BP",),
+        "RunawayPay": ("BP",),
+        "ShrinkSmash": ("BP","FP"),
+        "ShrinkStomp": ("BP","FP"),
+        "SleepStomp": ("BP","FP"),
+        "SmashCharge": ("BP","FP"),
+        "SpeedySpin": ("BP",),
+        "SpikeShield": ("BP",),
+        "SpinAttack": ("BP",),
+        "SpinSmash": ("BP","FP"),
+        "SuperFocus": ("BP",),
+        "SuperJump": ("BP","FP"),
+        "SuperJumpCharge": ("BP","FP"),
+        "SuperSmash": ("BP","FP"),
+        "SuperSmashCharge": ("BP","FP"),
+        "TripleDip": ("BP","FP"),
+        "ZapTap": ("BP",),
+    }.items()
+}
+
+_ALLOWED_PARTNER_KEYS: dict[str, frozenset[str]] = {
+    name: frozenset(moves) for name, moves in {
+        "Goombario": ("Charge","Multibonk"),
+        "Kooper": ("PowerShell","DizzyShell","FireShell"),
+        "Bombette": ("Bomb","PowerBomb","MegaBomb"),
+        "Parakarry": ("ShellShot","AirLift","AirRaid"),
+        "Bow": ("OuttaSight","Spook","FanSmack"),
+        "Watt": ("PowerShock","TurboCharge","MegaShock"),
+        "Sushie": ("Squirt","WaterBlock","TidalWave"),
+        "Lakilester": ("SpinySurge","CloudNine","Hurricane"),
+    }.items()
+}
+
+_ALLOWED_STARPOWER_KEYS: frozenset[str] = frozenset({
+    "Refresh",
+    "Lullaby",
+    "StarStorm",
+    "ChillOut",
+    "Smooch",
+    "TimeOut",
+    "UpAndAway",
+})
+
+_ALLOWED_COSTS_BP: frozenset[int] = frozenset(range(0, 11))
+_ALLOWED_COSTS_FP: range = range(0, 76)
+_ALLOWED_COSTS_SP: frozenset[int] = frozenset(range(0, 8))
+_ALLOWED_COSTS_BP_REPR: str = repr(sorted(_ALLOWED_COSTS_BP))
+_ALLOWED_COSTS_FP_REPR: str = repr(_ALLOWED_COSTS_FP)
+_ALLOWED_COSTS_SP_REPR: str = repr(sorted(_ALLOWED_COSTS_SP))
+
+# dict[spirit_name_or_chapter, chapter]
+_ALLOWED_SPIRITS: dict[str | int, int] = {
+    "Eldstar": 1,
+    "Mamar": 2,
+    "Skolar": 3,
+    "Muskular": 4,
+    "Misstar": 5,
+    "Klevar": 6,
+    "Kalmar": 7,
+    1: 1,
+    2: 2,
+    3: 3,
+    4: 4,
+    5: 5,
+    6: 6,
+    7: 7,
+}
+_ALLOWED_SPIRITS_REPR: str = repr(_ALLOWED_SPIRITS.keys())
+
+_ALLOWED_AREAS_REPR: str = repr(allowed_locations.keys())
+
+# Location tables flattened into sets of (area, location) pairs
+_ALLOWED_LOCATION_PAIRS: frozenset[tuple[str, str]] = frozenset(
+    (area, location)
+    for area, locations in allowed_locations.items()
+    for location in locations
+)
+_BLOCK_LOCATION_PAIRS: frozenset[tuple[str, str]] = frozenset(
+    (area, location)
+    for area, locations in block_locations.items()
+    for location in locations
+)
+_SHOP_LOCATION_PAIRS: frozenset[tuple[str, str]] = frozenset(
+    (area, location)
+    for area, locations in shop_locations.items()
+    for location in locations
+)
+_PRICE_FORBIDDEN_PAIRS: frozenset[tuple[str, str]] = frozenset(
+    (area, location)
+    for area, locations in disallowed_shop_locations.items()
+    for location in locations
+)
+_IGNORED_OPENSTARWAY_PAIRS: frozenset[tuple[str, str]] = frozenset(
+    (area, location)
+    for area, locations in ignored_locations_openstarway.items()
+    for location in locations
+)
+_IGNORED_BC_SHORTENED_PAIRS: frozenset[tuple[str, str]] = frozenset(
+    (area, location)
+    for area, locations in ignored_locations_bc_shortened.items()
+    for location in locations
+)
+_IGNORED_BC_BOSSRUSH_PAIRS: frozenset[tuple[str, str]] = frozenset(
+    (area, location)
+    for area, locations in ignored_locations_bc_bossrush.items()
+    for location in locations
+)
+# Traps cannot be placed into shops, nor into a few other specific locations
+_TRAP_FORBIDDEN_PAIRS: frozenset[tuple[str, str]] = _SHOP_LOCATION_PAIRS.union(
+    (area, location)
+    for area, location in _ALLOWED_LOCATION_PAIRS
+    if location in forbidden_trap_locations
+)
+
+# Item and location lists that only get membership tests, as frozensets
+_ALLOWED_ITEMS: frozenset[str] = frozenset(allowed_items)
+_ALLOWED_PLACEHOLDERS: frozenset[str] = frozenset(allowed_placeholders)
+_PROGRESSION_ITEMS: frozenset[str] = frozenset(progression_items)
+_ILLOGICAL_LOCATIONS: frozenset[str] = frozenset(illogical_locations)
+_FORCE_PUZZLERANDO_LOCATIONS: frozenset[str] = frozenset(force_puzzlerando_locations)
+_PARTNER_ITEMS: frozenset[str] = frozenset(partner_items)
+_ROWF_BADGES: frozenset[str] = frozenset(rowf_badges)
+_MERLOW_BADGES: frozenset[str] = frozenset(merlow_badges)
+_ORIGINAL_BADGES: frozenset[str] = frozenset(progressive_badges["originals"])
+_PROGRESSIVE_BADGES: frozenset[str] = frozenset(progressive_badges["progressives"])
+
+# Matches specific traps, e.g. "TRAP (Mushroom)", capturing the mimicked item
+_TRAP_RE: re.Pattern = re.compile(r"TRAP \((.*)\)")
+
+_DUNGEON_ENTRANCE_LOCATIONS_REPR: str = repr(dungeon_entrance_locations)
+_DUNGEONS_REPR: str = repr(dungeons)
+
 
 def validate_from_filepath(
-    file_path: str
+    file_path: str,
+    fail_fast: bool = False,
 ) -> tuple[dict, dict]:
     """
     Tries do decode a file at the provided file path as JSON.
     If successful, passes that JSON dict to the ``validate_from_dict`` function,
-    and returns that function's data.
+    and returns that function's data. ``fail_fast`` gets passed on as well.
+    Results are cached per file path, modification time and size, so
+    validating an unchanged file again skips decoding and validation. Call
+    ``validate_from_filepath.cache_clear()`` to drop all cached results.
+    """
+    file_stat = os.stat(file_path)
+
+    # Return a copy, so callers modifying the results don't alter the cache
+    return copy.deepcopy(_validate_from_filepath_cached(
+        os.path.abspath(file_path),
+        file_stat.st_mtime_ns,
+        file_stat.st_size,
+        fail_fast,
+    ))
+
+
+@lru_cache(maxsize=16)
+def _validate_from_filepath_cached(
+    file_path: str,
+    mtime_ns: int,
+    size: int,
+    fail_fast: bool,
+) -> tuple[dict, dict]:
+    """
+    Decodes and validates the file at the provided file path. ``mtime_ns`` and
+    ``size`` are only part of the cache key and invalidate cached results once
+    the file changes.
     """
     plando_data: dict = dict()
 
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            plando_data = json.load(file)
-    except json.decoder.JSONDecodeError as err:
+        with open(file_path, "rb") as file:
+            plando_data = _json_loads(file.read())
+    except ValueError as err:
+        # json.JSONDecodeError and orjson.JSONDecodeError both subclass this
         return {}, {"warnings": [], "errors": [f"Could not decode JSON! {err}"]}
 
-    return validate_from_dict(plando_data)
+    return validate_from_dict(plando_data, fail_fast)
+
+
+validate_from_filepath.cache_clear = _validate_from_filepath_cached.cache_clear
+
+
+def validate_many(
+    file_paths: Iterable[str],
+    workers: int | None = None,
+    fail_fast: bool = False,
+) -> dict[str, tuple[dict, dict]]:
+    """
+    Validates multiple plando files in parallel worker processes, passing
+    each file path to the ``validate_from_filepath`` function. Returns a dict
+    mapping each file path to that function's data.
+    ``workers`` sets the number of processes, defaulting to the number of
+    CPUs. Each worker loads the plando metadata once on import, so this only
+    pays off when validating more than a handful of files.
+    Files that cannot be read are reported as errors for that file, so one
+    bad path does not discard the results of the other files.
+    On platforms that spawn worker processes (Windows, macOS), the calling
+    script needs an ``if __name__ == "__main__":`` guard.
+    """
+    # Imported here, as it pulls in multiprocessing, which most users of this
+    # module never need
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            _validate_many_worker,
+            file_paths,
+            repeat(fail_fast),
+            chunksize=4,
+        )
+        return dict(results)
+
+
+def _validate_many_worker(
+    file_path: str,
+    fail_fast: bool,
+) -> tuple[str, tuple[dict, dict]]:
+    """
+    Runs ``validate_from_filepath`` within a ``validate_many`` worker process,
+    turning file access errors into an error message for that file. Returns
+    the file path alongside the result, so ``file_paths`` only gets iterated
+    once.
+    """
+    try:
+        return file_path, validate_from_filepath(file_path, fail_fast)
+    except OSError as err:
+        return file_path, ({}, {"warnings": [], "errors": [f"Could not read file! {err}"]})
 
 
 def validate_from_dict(
-    plando_data: dict
+    plando_data: dict,
+    fail_fast: bool = False,
 ) -> tuple[dict, dict]:
     """
     Validate and parse the provided ``plando_data`` dictionary according to a
     defined set of rules, then return the parsed data if not errors occured.
     Any warnings and errors get collected and returned as a second dict.
+    If ``fail_fast`` is set, validation stops at the first entry causing an
+    error, so only the messages found up to that point get returned.
     """
     parsed_data: dict = dict()
     messages: dict[str, list[str]] = dict()
 
-    implemented_toplevel_fields: list[str] = [
-        TOPLEVEL_FIELD_DIFFICULTY,
-        TOPLEVEL_FIELD_MOVE_COSTS,
-        TOPLEVEL_FIELD_BOSS_BATTLES,
-        TOPLEVEL_FIELD_REQUIRED_SPIRITS,
-        TOPLEVEL_FIELD_ITEMS,
-        TOPLEVEL_FIELD_DUNGEON_ENTRANCES,
-    ]
-
     messages["warnings"] = list()
     messages["errors"] = list()
     messages_wrn = messages["warnings"]
@@ -88,72 +407,25 @@ def validate_from_dict(
         err_msg = "Provided plando_data is empty"
         messages_err.append(err_msg)
         return ret_tuple
+    if not isinstance(plando_data, dict):
+        messages_err.append(f"Provided plando_data has wrong data type (expected dict): ({type(plando_data).__name__})")
+        return ret_tuple
 
-    for k in plando_data:
+    for k, v in plando_data.items():
+        if fail_fast and messages_err:
+            break
         if not isinstance(k, str):
-            messages_err.append(f"Plando data includes top level field of wrong type (expected str): \"{k}\" ({type(k)})")
-        elif k not in implemented_toplevel_fields:
+            messages_err.append(f"Plando data includes top level field of wrong type (expected str): \"{k}\" ({type(k).__name__})")
+            continue
+        toplevel_field = _TOPLEVEL_DISPATCH.get(k)
+        if toplevel_field is None:
             messages_wrn.append(f"Plando data includes unhandled top level field: \"{k}\"")
+            continue
 
-        elif k == TOPLEVEL_FIELD_DIFFICULTY:
-            if plando_data[k] is not None and not isinstance(plando_data[k], dict):
-                messages_err.append(f"Top-level key has wrong data type (expected dict or null): \"{plando_data[k]}\" ({type(plando_data[k])})")
-                continue
-            difficulties, new_wrns, new_errs = _get_difficulty(plando_data[k])
-
-            parsed_data[TOPLEVEL_FIELD_DIFFICULTY] = difficulties
-            messages_wrn.extend(new_wrns)
-            messages_err.extend(new_errs)
-
-        elif k == TOPLEVEL_FIELD_MOVE_COSTS:
-            if plando_data[k] is not None and not isinstance(plando_data[k], dict):
-                messages_err.append(f"Top-level key has wrong data type (expected dict or null): \"{plando_data[k]}\" ({type(plando_data[k])})")
-                continue
-            move_costs, new_wrns, new_errs = _get_move_costs(plando_data[k])
-
-            parsed_data[TOPLEVEL_FIELD_MOVE_COSTS] = move_costs
-            messages_wrn.extend(new_wrns)
-            messages_err.extend(new_errs)
-
-        elif k == TOPLEVEL_FIELD_BOSS_BATTLES:
-            if plando_data[k] is not None and not isinstance(plando_data[k], dict):
-                messages_err.append(f"Top-level key has wrong data type (expected dict or null): \"{plando_data[k]}\" ({type(plando_data[k])})")
-                continue
-            boss_battles, new_wrns, new_errs = _get_boss_battles(plando_data[k])
-
-            parsed_data[TOPLEVEL_FIELD_BOSS_BATTLES] = boss_battles
-            messages_wrn.extend(new_wrns)
-            messages_err.extend(new_errs)
-
-        elif k == TOPLEVEL_FIELD_REQUIRED_SPIRITS:
-            if plando_data[k] is not None and not isinstance(plando_data[k], list):
-                messages_err.append(f"Top-level key has wrong data type (expected list or null): \"{plando_data[k]}\" ({type(plando_data[k])})")
-                continue
-            required_spirits, new_wrns, new_errs = _get_required_spirits(plando_data[k])
-
-            parsed_data[TOPLEVEL_FIELD_REQUIRED_SPIRITS] = required_spirits
-            messages_wrn.extend(new_wrns)
-            messages_err.extend(new_errs)
-
-        elif k == TOPLEVEL_FIELD_ITEMS:
-            if plando_data[k] is not None and not isinstance(plando_data[k], dict):
-                messages_err.append(f"Top-level key has wrong data type (expected dict or null): \"{plando_data[k]}\" ({type(plando_data[k])})")
-                continue
-            item_placement, new_wrns, new_errs = _get_item_placement(plando_data[k])
-
-            parsed_data[TOPLEVEL_FIELD_ITEMS] = item_placement
-            messages_wrn.extend(new_wrns)
-            messages_err.extend(new_errs)
-
-        elif k == TOPLEVEL_FIELD_DUNGEON_ENTRANCES:
-            if plando_data[k] is not None and not isinstance(plando_data[k], dict):
-                messages_err.append(f"Top-level key has wrong data type (expected dict or null): \"{plando_data[k]}\" ({type(plando_data[k])})")
-                continue
-            dungeon_entrances, new_wrns, new_errs = _get_dungeon_entrances(plando_data[k])
-
-            parsed_data[TOPLEVEL_FIELD_DUNGEON_ENTRANCES] = dungeon_entrances
-            messages_wrn.extend(new_wrns)
-            messages_err.extend(new_errs)
+        expected_type, type_label, get_field_data = toplevel_field
+        if not _check_toplevel_type(v, expected_type, type_label, messages_err):
+            continue
+        parsed_data[k] = get_field_data(v, messages_wrn, messages_err, fail_fast)
 
     if messages_err:
         parsed_data.clear()
@@ -161,9 +433,28 @@ def validate_from_dict(
     return ret_tuple
 
 
+def _check_toplevel_type(
+    value,
+    expected_type: type,
+    type_label: str,
+    new_errs: list[str],
+) -> bool:
+    """
+    Checks if the value of a top-level field is either null or of the
+    expected type. If not, an error gets appended to ``new_errs``.
+    """
+    if value is None or isinstance(value, expected_type):
+        return True
+    new_errs.append(f"Top-level key has wrong data type (expected {type_label} or null): \"{value}\" ({type(value).__name__})")
+    return False
+
+
 def _get_difficulty(
-    difficulties: dict[str, int] | None
-) -> tuple[dict[int, int], list[str], list[str]]:
+    difficulties: dict[str, int] | None,
+    new_wrns: list[str],
+    new_errs: list[str],
+    fail_fast: bool = False,
+) -> dict[int, int]:
     """
     Validates and parses chapter difficulties.
     The allowed chapters to set are ch1-ch7, and the allowed difficulty
@@ -174,60 +465,51 @@ def _get_difficulty(
     difficulty value outside of the allowed range.
     """
     parsed_difficulties: dict[int, int] = dict()
-    new_wrns: list[str] = list()
-    new_errs: list[str] = list()
 
     if difficulties is None:
-        return parsed_difficulties, new_wrns, new_errs
-
-    allowed_keys = [
-        "chapter 1",
-        "chapter 2",
-        "chapter 3",
-        "chapter 4",
-        "chapter 5",
-        "chapter 6",
-        "chapter 7",
-    ]
-    allowed_values = [1,2,3,4,5,6,7,8]
-
-    starting_chapters = ["chapter 1", "chapter 2", "chapter 5"]
+        return parsed_difficulties
 
     for k, v in difficulties.items():
+        if fail_fast and new_errs:
+            return parsed_difficulties
         # Check datatypes for key and value
         new_err_found = False
         if not isinstance(k, str):
-            new_errs.append(f"difficulty: Key has wrong data type (expected str): \"{k}\" ({type(k)})")
+            new_errs.append(f"difficulty: Key has wrong data type (expected str): \"{k}\" ({type(k).__name__})")
             new_err_found = True
-        if v is not None and not isinstance(v, int):
-            new_errs.append(f"difficulty: Value has wrong data type (expected int or null): \"{v}\" ({type(v)})")
+        if v is not None and type(v) is not int:
+            new_errs.append(f"difficulty: Value has wrong data type (expected int or null): \"{v}\" ({type(v).__name__})")
             new_err_found = True
         if new_err_found:
             continue
 
         # Check if key and value are in allowed ranges
-        if k not in allowed_keys:
-            new_wrns.append(f"difficulty: Found unexpected Key: \"{k}\" (not one of {allowed_keys=})")
-            continue
-        if v is not None and v not in allowed_values:
-            new_errs.append(f"difficulty: Found disallowed Value: {v} (not one of {allowed_values=} or null)")
+        if k not in _CHAPTER_KEY_TO_INT:
+            new_wrns.append(f"difficulty: Found unexpected Key: \"{k}\" (not one of allowed_keys={_CHAPTER_KEYS_REPR})")
             continue
 
         # Check if value is unset
         if v is None:
             continue
 
+        if v not in _DIFF_ALLOWED_VALUES:
+            new_errs.append(f"difficulty: Found disallowed Value: {v} (not one of allowed_values={_DIFF_ALLOWED_VALUES_REPR} or null)")
+            continue
+
         # Check if key is a starting chapter and value is over difficulty 3
-        if k in starting_chapters and v > 3:
+        if k in _DIFF_STARTING_CHAPTERS and v > 3:
             new_wrns.append(f"difficulty: {k} is scaled higher than difficulty 3. Beware if this is the starting location")
 
-        parsed_difficulties[int(k[-1:])] = v
+        parsed_difficulties[_CHAPTER_KEY_TO_INT[k]] = v
 
-    return parsed_difficulties, new_wrns, new_errs
+    return parsed_difficulties
 
 
 def _get_move_costs(
-    move_costs: dict[str, dict[str, dict[str, int | None]]] | None
+    move_costs: dict[str, dict[str, dict[str, int | None]]] | None,
+    new_wrns: list[str],
+    new_errs: list[str],
+    fail_fast: bool = False,
 ) -> dict[str, dict[str, dict[str, int]]]:
     """
     Validates and parses the BP-, FP-, and SP-costs for badges, moves (both
@@ -244,281 +526,214 @@ def _get_move_costs(
     # also starpower cost are 'FP', for reasons
     parsed_move_costs: dict[str, dict[str, dict[str, int]]] = dict()
 
-    new_wrns: list[str] = list()
-    new_errs: list[str] = list()
-
     if move_costs is None:
-        return parsed_move_costs, new_wrns, new_errs
-
-    allowed_toplevel_keys = [
-        "badge",
-        "partner",
-        "starpower"
-    ]
-
-    allowed_badge_keys = {
-        "AllorNothing": ["BP"],
-        "AutoJump": ["BP","FP"],
-        "AutoSmash": ["BP","FP"],
-        "Autobounce": ["BP","FP"],
-        "Berserker": ["BP"],
-        "BumpAttack": ["BP"],
-        "ChillOut": ["BP"],
-        "CloseCall": ["BP"],
-        "CrazyHeart": ["BP"],
-        "DDownJump": ["BP","FP"],
-        "DDownPound": ["BP","FP"],
-        "DamageDodge": ["BP"],
-        "DeepFocus": ["BP"],
-        "DefendPlus": ["BP"],
-        "DizzyAttack": ["BP"],
-        "DizzyStomp": ["BP","FP"],
-        "DodgeMaster": ["BP"],
-        "DoubleDip": ["BP","FP"],
-        "FPPlus": ["BP"],
-        "FeelingFine": ["BP"],
-        "FireShield": ["BP"],
-        "FirstAttack": ["BP"],
-        "FlowerFanatic": ["BP"],
-        "FlowerFinder": ["BP"],
-        "FlowerSaver": ["BP"],
-        "GroupFocus": ["BP"],
-        "HPDrain": ["BP"],
-        "HPPlus": ["BP"],
-        "HammerThrow": ["BP","FP"],
-        "HappyFlower": ["BP"],
-        "HappyHeart": ["BP"],
-        "HealthyHealthy": ["BP"],
-        "HeartFinder": ["BP"],
-        "ISpy": ["BP"],
-        "IcePower": ["BP"],
-        "JumpCharge": ["BP","FP"],
-        "LastStand": ["BP"],
-        "LuckyDay": ["BP"],
-        "MegaHPDrain": ["BP"],
-        "MegaJump": ["BP","FP"],
-        "MegaQuake": ["BP","FP"],
-        "MegaRush": ["BP"],
-        "MegaSmash": ["BP","FP"],
-        "MiniJumpCharge": ["BP","FP"],
-        "MiniSmashCharge": ["BP","FP"],
-        "MoneyMoney": ["BP"],
-        "Multibounce": ["BP","FP"],
-        "PDownDUp": ["BP"],
-        "PUpDDown": ["BP"],
-        "PayOff": ["BP"],
-        "Peekaboo": ["BP"],
-        "PowerBounce": ["BP","FP"],
-        "PowerJump": ["BP","FP"],
-        "PowerPlus": ["BP"],
-        "PowerQuake": ["BP","FP"],
-        "PowerRush": ["BP"],
-        "PowerSmash": ["BP","FP"],
-        "PrettyLucky": ["BP"],
-        "QuakeBounce": ["BP","FP"],
-        "QuakeHammer": ["BP","FP"],
-        "QuickChange": ["BP"],
-        "Refund": ["BP"],
-        "RightOn": ["BP"],
-        "RunawayPay": ["BP"],
-        "ShrinkSmash": ["BP","FP"],
-        "ShrinkStomp": ["BP","FP"],
-        "SleepStomp": ["BP","FP"],
-        "SmashCharge": ["BP","FP"],
-        "SpeedySpin": ["BP"],
-        "SpikeShield": ["BP"],
-        "SpinAttack": ["BP"],
-        "SpinSmash": ["BP","FP"],
-        "SuperFocus": ["BP"],
-        "SuperJump": ["BP","FP"],
-        "SuperJumpCharge": ["BP","FP"],
-        "SuperSmash": ["BP","FP"],
-        "SuperSmashCharge": ["BP","FP"],
-        "TripleDip": ["BP","FP"],
-        "ZapTap": ["BP"],
-    }
-
-    allowed_partner_keys = {
-        "Goombario": ["Charge","Multibonk"],
-        "Kooper": ["PowerShell","DizzyShell","FireShell"],
-        "Bombette": ["Bomb","PowerBomb","MegaBomb"],
-        "Parakarry": ["ShellShot","AirLift","AirRaid"],
-        "Bow": ["OuttaSight","Spook","FanSmack"],
-        "Watt": ["PowerShock","TurboCharge","MegaShock"],
-        "Sushie": ["Squirt","WaterBlock","TidalWave"],
-        "Lakilester": ["SpinySurge","CloudNine","Hurricane"]
-    }
-
-    allowed_starpower_keys = [
-        "Refresh",
-        "Lullaby",
-        "StarStorm",
-        "ChillOut",
-        "Smooch",
-        "TimeOut",
-        "UpAndAway",
-    ]
-
-    allowed_costs_bp = [0,1,2,3,4,5,6,7,8,9,10]
-    allowed_costs_fp = range(0, 76)
-    allowed_costs_sp = [0,1,2,3,4,5,6,7]
+        return parsed_move_costs
 
     for k, v in move_costs.items():
+        if fail_fast and new_errs:
+            return parsed_move_costs
         # Check datatypes for top-level key and value
         new_err_found = False
         if not isinstance(k, str):
-            new_errs.append(f"move_costs: Top-level key has wrong data type (expected str): \"{k}\" ({type(k)})")
+            new_errs.append(f"move_costs: Top-level key has wrong data type (expected str): \"{k}\" ({type(k).__name__})")
             new_err_found = True
         if v is not None and not isinstance(v, dict):
-            new_errs.append(f"move_costs: Top-level value has wrong data type (expected dict or null): \"{v}\" ({type(v)})")
+            new_errs.append(f"move_costs: Top-level value has wrong data type (expected dict or null): \"{v}\" ({type(v).__name__})")
             new_err_found = True
         if new_err_found:
             continue
 
         # Check if top-level key is in allowed ranged
-        if k not in allowed_toplevel_keys:
-            new_wrns.append(f"move_costs: Found unexpected Top-level key: \"{k}\" (not one of {allowed_toplevel_keys=})")
+        if k not in _MOVE_COSTS_TOPLEVEL_KEYS:
+            new_wrns.append(f"move_costs: Found unexpected Top-level key: \"{k}\" (not one of allowed_toplevel_keys={_MOVE_COSTS_TOPLEVEL_KEYS_REPR})")
             continue
-        elif v is not None:
-            # Check datatypes for mid-level key and value
-            if not isinstance(v, dict):
-                new_errs.append(f"move_costs: Mid-level value for \"{k}\" key has wrong data type (expected dict or null): \"{v}\" ({type(v)})")
-
-            if k == "badge":
-                for badge_name, badge_dict in move_costs[k].items():
-                    # Check datatypes for badges key and value
-                    if not isinstance(badge_name, str):
-                        new_wrns.append(f"move_costs: Badge name key \"{badge_name}\" has wrong data type (expected str): \"{badge_name}\" ({type(badge_name)})")
-                        continue
-                    if badge_dict is not None and not isinstance(badge_dict, dict):
-                        new_errs.append(f"move_costs: Mid-level value for badge name key \"{badge_name}\" has wrong data type (expected dict or null): \"{badge_dict}\" ({type(badge_dict)})")
-                        continue
 
-                    # Check if value is unset
-                    if badge_dict is None:
-                        continue
+        # Check if value is unset
+        if v is None:
+            continue
 
-                    # Check if badge key is in allowed list
-                    if badge_name not in allowed_badge_keys:
-                        new_wrns.append(f"move_costs: Badge name key \"{badge_name}\" is not a valid badge name")
-                        continue
+        parsed_section = _MOVE_COSTS_DISPATCH[k](v, new_wrns, new_errs, fail_fast)
+        if parsed_section:
+            parsed_move_costs[k] = parsed_section
 
-                    # Check for allowed badge costs
-                    for badge_cost_type, badge_cost in badge_dict.items():
-                        # Check badge cost data types
-                        if not isinstance(badge_cost_type, str):
-                            new_errs.append(f"move_costs: Badge cost type of badge \"{badge_name}\" has wrong data type (expected str): \"{badge_cost_type}\" ({type(badge_cost_type)})")
-                            continue
-                        if badge_cost is not None and not isinstance(badge_cost, int):
-                            new_errs.append(f"move_costs: Badge cost of badge \"{badge_name}\" has wrong data type (expected int): \"{badge_cost}\" ({type(badge_cost)})")
-                            continue
+    return parsed_move_costs
 
-                        # Check badge cost allowed ranges
-                        if badge_cost_type not in allowed_badge_keys[badge_name]:
-                            new_wrns.append(f"move_costs: Badge cost type \"{badge_cost_type}\" of badge \"{badge_name}\" is not a valid cost type for this badge")
-                            continue
-                        if badge_cost is not None and badge_cost_type == "BP" and badge_cost not in allowed_costs_bp:
-                            new_errs.append(f"move_costs: Found disallowed Value: Badge cost \"{badge_cost}\" of badge \"{badge_name}:{badge_cost_type}\" (not one of {allowed_costs_bp=} or null)")
-                            continue
-                        if badge_cost is not None and badge_cost_type == "FP" and badge_cost not in allowed_costs_fp:
-                            new_errs.append(f"move_costs: Found disallowed Value: Badge cost \"{badge_cost}\" of badge \"{badge_name}:{badge_cost_type}\" (not one of {allowed_costs_fp=} or null)")
-                            continue
 
-                        # Check if value is unset
-                        if badge_cost is None:
-                            continue
+def _get_badge_costs(
+    section: dict,
+    new_wrns: list[str],
+    new_errs: list[str],
+    fail_fast: bool = False,
+) -> dict[str, dict[str, int]]:
+    """
+    Validates and parses the "badge" section of the move costs.
+    """
+    parsed_badge_costs: dict[str, dict[str, int]] = dict()
+
+    for badge_name, badge_dict in section.items():
+        if fail_fast and new_errs:
+            return parsed_badge_costs
+        # Check datatypes for badges key and value
+        if not isinstance(badge_name, str):
+            new_wrns.append(f"move_costs: Badge name key \"{badge_name}\" has wrong data type (expected str): \"{badge_name}\" ({type(badge_name).__name__})")
+            continue
+        if badge_dict is not None and not isinstance(badge_dict, dict):
+            new_errs.append(f"move_costs: Mid-level value for badge name key \"{badge_name}\" has wrong data type (expected dict or null): \"{badge_dict}\" ({type(badge_dict).__name__})")
+            continue
 
-                        if k not in parsed_move_costs:
-                            parsed_move_costs[k] = dict()
-                        if badge_name not in parsed_move_costs[k]:
-                            parsed_move_costs[k][badge_name] = dict()
-                        parsed_move_costs[k][badge_name][badge_cost_type] = badge_cost
-
-            elif k == "partner":
-                for partner_name, partner_dict in move_costs[k].items():
-                    # Check datatypes for partners key and value
-                    if not isinstance(partner_name, str):
-                        new_wrns.append(f"move_costs: partner name key \"{partner_name}\" has wrong data type (expected str): \"{partner_name}\" ({type(partner_name)})")
-                        continue
-                    if partner_dict is not None and not isinstance(partner_dict, dict):
-                        new_errs.append(f"move_costs: Mid-level value for partner name key \"{partner_name}\" has wrong data type (expected dict or null): \"{partner_dict}\" ({type(partner_dict)})")
-                        continue
+        # Check if value is unset
+        if badge_dict is None:
+            continue
 
-                    # Check if value is unset
-                    if partner_dict is None:
-                        continue
+        # Check if badge key is in allowed list
+        if badge_name not in _ALLOWED_BADGE_KEYS:
+            new_wrns.append(f"move_costs: Badge name key \"{badge_name}\" is not a valid badge name")
+            continue
 
-                    # Check if partner key is in allowed list
-                    if partner_name not in allowed_partner_keys:
-                        new_wrns.append(f"move_costs: partner name key \"{partner_name}\" is not a valid partner name")
-                        continue
+        # Check for allowed badge costs
+        for badge_cost_type, badge_cost in badge_dict.items():
+            if fail_fast and new_errs:
+                return parsed_badge_costs
+            # Check badge cost data types
+            if not isinstance(badge_cost_type, str):
+                new_errs.append(f"move_costs: Badge cost type of badge \"{badge_name}\" has wrong data type (expected str): \"{badge_cost_type}\" ({type(badge_cost_type).__name__})")
+                continue
+            if badge_cost is not None and type(badge_cost) is not int:
+                new_errs.append(f"move_costs: Badge cost of badge \"{badge_name}\" has wrong data type (expected int): \"{badge_cost}\" ({type(badge_cost).__name__})")
+                continue
 
-                    # Check for allowed partner move costs
-                    for partner_move, partner_move_cost in partner_dict.items():
-                        # Check partner_dict data types
-                        if not isinstance(partner_move, str):
-                            new_errs.append(f"move_costs: partner move of partner \"{partner_name}\" has wrong data type (expected str): \"{partner_move}\" ({type(partner_move)})")
-                            continue
-                        if partner_move_cost is not None and not isinstance(partner_move_cost, int):
-                            new_errs.append(f"move_costs: partner move cost of \"{partner_name}:{partner_move}\" has wrong data type (expected int): \"{partner_move_cost}\" ({type(partner_move_cost)})")
-                            continue
+            # Check badge cost allowed ranges
+            if badge_cost_type not in _ALLOWED_BADGE_KEYS[badge_name]:
+                new_wrns.append(f"move_costs: Badge cost type \"{badge_cost_type}\" of badge \"{badge_name}\" is not a valid cost type for this badge")
+                continue
 
-                        # Check valid partner moves and allowed ranges
-                        if partner_move not in allowed_partner_keys[partner_name]:
-                            new_wrns.append(f"move_costs: partner move \"{partner_move}\" of partner \"{partner_name}\" is not a valid move for this partners")
-                            continue
-                        if partner_move_cost is not None and partner_move_cost not in allowed_costs_fp:
-                            new_errs.append(f"move_costs: Found disallowed Value: partner move cost \"{partner_move_cost}\" of partner \"{partner_name}\" (not one of {allowed_costs_fp=} or null)")
-                            continue
+            # Check if value is unset
+            if badge_cost is None:
+                continue
 
-                        if partner_move_cost == 0:
-                            new_wrns.append(f"move_costs: FP cost of \"{partner_name}:{partner_move}\" set to zero. This will cause weirdness in battle menues.")
+            if badge_cost_type == "BP" and badge_cost not in _ALLOWED_COSTS_BP:
+                new_errs.append(f"move_costs: Found disallowed Value: Badge cost \"{badge_cost}\" of badge \"{badge_name}:{badge_cost_type}\" (not one of allowed_costs_bp={_ALLOWED_COSTS_BP_REPR} or null)")
+                continue
+            if badge_cost_type == "FP" and badge_cost not in _ALLOWED_COSTS_FP:
+                new_errs.append(f"move_costs: Found disallowed Value: Badge cost \"{badge_cost}\" of badge \"{badge_name}:{badge_cost_type}\" (not one of allowed_costs_fp={_ALLOWED_COSTS_FP_REPR} or null)")
+                continue
 
-                        # Check if value is unset
-                        if partner_move_cost is None:
-                            continue
+            parsed_badge_costs.setdefault(badge_name, dict())[badge_cost_type] = badge_cost
 
-                        if k not in parsed_move_costs:
-                            parsed_move_costs[k] = dict()
-                        if partner_move not in parsed_move_costs[k]:
-                            parsed_move_costs[k][partner_move] = dict()
-                        parsed_move_costs[k][partner_move]["FP"] = partner_move_cost
-
-            elif k == "starpower":
-                for starpower_name, starpower_cost in move_costs[k].items():
-                    # Check datatypes for starpowers key and value
-                    if not isinstance(starpower_name, str):
-                        new_wrns.append(f"move_costs: starpower name key \"{starpower_name}\" has wrong data type (expected str): \"{starpower_name}\" ({type(starpower_name)})")
-                        continue
-                    if starpower_cost is not None and not isinstance(starpower_cost, int):
-                        new_errs.append(f"move_costs: value for starpower cost of \"{starpower_name}\" has wrong data type (expected int or null): \"{starpower_cost}\" ({type(starpower_cost)})")
-                        continue
+    return parsed_badge_costs
 
-                    # Check if starpower key is in allowed list
-                    if starpower_name not in allowed_starpower_keys:
-                        new_wrns.append(f"move_costs: starpower name key \"{starpower_name}\" is not a valid starpower name")
-                        continue
 
-                    # Check starpower cost allowed ranges
-                    if starpower_cost is not None and starpower_cost not in allowed_costs_sp:
-                        new_errs.append(f"move_costs: Found disallowed Value: starpower cost \"{starpower_cost}\" of starpower \"{starpower_name}\" (not one of {allowed_costs_sp=} or null)")
-                        continue
+def _get_partner_costs(
+    section: dict,
+    new_wrns: list[str],
+    new_errs: list[str],
+    fail_fast: bool = False,
+) -> dict[str, dict[str, int]]:
+    """
+    Validates and parses the "partner" section of the move costs.
+    """
+    parsed_partner_costs: dict[str, dict[str, int]] = dict()
+
+    for partner_name, partner_dict in section.items():
+        if fail_fast and new_errs:
+            return parsed_partner_costs
+        # Check datatypes for partners key and value
+        if not isinstance(partner_name, str):
+            new_wrns.append(f"move_costs: partner name key \"{partner_name}\" has wrong data type (expected str): \"{partner_name}\" ({type(partner_name).__name__})")
+            continue
+        if partner_dict is not None and not isinstance(partner_dict, dict):
+            new_errs.append(f"move_costs: Mid-level value for partner name key \"{partner_name}\" has wrong data type (expected dict or null): \"{partner_dict}\" ({type(partner_dict).__name__})")
+            continue
 
-                    # Check if value is unset
-                    if starpower_cost is None:
-                        continue
+        # Check if value is unset
+        if partner_dict is None:
+            continue
+
+        # Check if partner key is in allowed list
+        if partner_name not in _ALLOWED_PARTNER_KEYS:
+            new_wrns.append(f"move_costs: partner name key \"{partner_name}\" is not a valid partner name")
+            continue
+
+        # Check for allowed partner move costs
+        for partner_move, partner_move_cost in partner_dict.items():
+            if fail_fast and new_errs:
+                return parsed_partner_costs
+            # Check partner_dict data types
+            if not isinstance(partner_move, str):
+                new_errs.append(f"move_costs: partner move of partner \"{partner_name}\" has wrong data type (expected str): \"{partner_move}\" ({type(partner_move).__name__})")
+                continue
+            if partner_move_cost is not None and type(partner_move_cost) is not int:
+                new_errs.append(f"move_costs: partner move cost of \"{partner_name}:{partner_move}\" has wrong data type (expected int): \"{partner_move_cost}\" ({type(partner_move_cost).__name__})")
+                continue
+
+            # Check valid partner moves and allowed ranges
+            if partner_move not in _ALLOWED_PARTNER_KEYS[partner_name]:
+                new_wrns.append(f"move_costs: partner move \"{partner_move}\" of partner \"{partner_name}\" is not a valid move for this partners")
+                continue
 
-                    if k not in parsed_move_costs:
-                        parsed_move_costs[k] = dict()
-                    parsed_move_costs[k][starpower_name] = dict()
-                    parsed_move_costs[k][starpower_name]["FP"] = starpower_cost
+            # Check if value is unset
+            if partner_move_cost is None:
+                continue
+
+            if partner_move_cost not in _ALLOWED_COSTS_FP:
+                new_errs.append(f"move_costs: Found disallowed Value: partner move cost \"{partner_move_cost}\" of partner \"{partner_name}\" (not one of allowed_costs_fp={_ALLOWED_COSTS_FP_REPR} or null)")
+                continue
+
+            if partner_move_cost == 0:
+                new_wrns.append(f"move_costs: FP cost of \"{partner_name}:{partner_move}\" set to zero. This will cause weirdness in battle menues.")
+
+            parsed_partner_costs.setdefault(partner_move, dict())["FP"] = partner_move_cost
+
+    return parsed_partner_costs
 
-    return parsed_move_costs, new_wrns, new_errs
+
+def _get_starpower_costs(
+    section: dict,
+    new_wrns: list[str],
+    new_errs: list[str],
+    fail_fast: bool = False,
+) -> dict[str, dict[str, int]]:
+    """
+    Validates and parses the "starpower" section of the move costs.
+    """
+    parsed_starpower_costs: dict[str, dict[str, int]] = dict()
+
+    for starpower_name, starpower_cost in section.items():
+        if fail_fast and new_errs:
+            return parsed_starpower_costs
+        # Check datatypes for starpowers key and value
+        if not isinstance(starpower_name, str):
+            new_wrns.append(f"move_costs: starpower name key \"{starpower_name}\" has wrong data type (expected str): \"{starpower_name}\" ({type(starpower_name).__name__})")
+            continue
+        if starpower_cost is not None and type(starpower_cost) is not int:
+            new_errs.append(f"move_costs: value for starpower cost of \"{starpower_name}\" has wrong data type (expected int or null): \"{starpower_cost}\" ({type(starpower_cost).__name__})")
+            continue
+
+        # Check if starpower key is in allowed list
+        if starpower_name not in _ALLOWED_STARPOWER_KEYS:
+            new_wrns.append(f"move_costs: starpower name key \"{starpower_name}\" is not a valid starpower name")
+            continue
+
+        # Check if value is unset
+        if starpower_cost is None:
+            continue
+
+        # Check starpower cost allowed ranges
+        if starpower_cost not in _ALLOWED_COSTS_SP:
+            new_errs.append(f"move_costs: Found disallowed Value: starpower cost \"{starpower_cost}\" of starpower \"{starpower_name}\" (not one of allowed_costs_sp={_ALLOWED_COSTS_SP_REPR} or null)")
+            continue
+
+        parsed_starpower_costs[starpower_name] = {"FP": starpower_cost}
+
+    return parsed_starpower_costs
 
 
 def _get_boss_battles(
-    boss_battles: dict[str, str] | None
-) -> tuple[dict[int, int], list[str], list[str]]:
+    boss_battles: dict[str, str] | None,
+    new_wrns: list[str],
+    new_errs: list[str],
+    fail_fast: bool = False,
+) -> dict[int, int]:
     """
     Validates and parses boss battles.
     The allowed chapters to set are ch1-ch7, and the allowed bosses are Koopa
@@ -531,68 +746,52 @@ def _get_boss_battles(
     """
     parsed_boss_battles: dict[int, int] = dict()
 
-    new_wrns: list[str] = list()
-    new_errs: list[str] = list()
-
     if boss_battles is None:
-        return parsed_boss_battles, new_wrns, new_errs
-
-    allowed_keys = [
-        "chapter 1",
-        "chapter 2",
-        "chapter 3",
-        "chapter 4",
-        "chapter 5",
-        "chapter 6",
-        "chapter 7",
-    ]
-    allowed_values = [
-        "KoopaBros",
-        "Tutankoopa",
-        "TubbasHeart",
-        "GeneralGuy",
-        "LavaPiranha",
-        "HuffNPuff",
-        "CrystalKing",
-    ]
+        return parsed_boss_battles
 
     for k, v in boss_battles.items():
+        if fail_fast and new_errs:
+            return parsed_boss_battles
         # Check datatypes for key and value
         new_err_found = False
         if not isinstance(k, str):
-            new_errs.append(f"boss_battles: key has wrong data type (expected str): \"{k}\" ({type(k)})")
+            new_errs.append(f"boss_battles: key has wrong data type (expected str): \"{k}\" ({type(k).__name__})")
             new_err_found = True
         if v is not None and not isinstance(v, str):
-            new_errs.append(f"boss_battles: value has wrong data type (expected str or null): \"{v}\" ({type(v)})")
+            new_errs.append(f"boss_battles: value has wrong data type (expected str or null): \"{v}\" ({type(v).__name__})")
             new_err_found = True
         if new_err_found:
             continue
 
         # Check if key and value are in allowed ranges
-        if k not in allowed_keys:
-            new_wrns.append(f"boss_battles: found unexpected Key: \"{k}\" (not one of {allowed_keys=})")
-            continue
-        if v is not None and v not in allowed_values:
-            new_errs.append(f"boss_battles: found disallowed Value: {v} (not one of {allowed_values=} or null)")
+        if k not in _CHAPTER_KEY_TO_INT:
+            new_wrns.append(f"boss_battles: found unexpected Key: \"{k}\" (not one of allowed_keys={_CHAPTER_KEYS_REPR})")
             continue
 
         # Check if value is unset
         if v is None:
             continue
 
-        parsed_boss_battles[int(k[-1:])] = allowed_values.index(v) + 1
+        if v not in _BOSS_VALUE_TO_INDEX:
+            new_errs.append(f"boss_battles: found disallowed Value: {v} (not one of allowed_values={_BOSS_ALLOWED_VALUES_REPR} or null)")
+            continue
+
+        parsed_boss_battles[_CHAPTER_KEY_TO_INT[k]] = _BOSS_VALUE_TO_INDEX[v]
 
-    if parsed_boss_battles and len(set(list(parsed_boss_battles.values()))) != 7:
+    if parsed_boss_battles and len(set(parsed_boss_battles.values())) != 7:
         new_wrns.append(f"boss_battles: not all 7 bosses are plando'd. "
             "Beware of scaling oddities if a boss appears multiple times if progressive scaling is turned off"
         )
 
-    return parsed_boss_battles, new_wrns, new_errs
+    return parsed_boss_battles
 
 
 def _get_required_spirits(
-    required_spirits: list[str | int] | None
-) -> tuple[list[int], list[str], list[str]]:
+    required_spirits: list[str | int] | None,
+    new_wrns: list[str],
+    new_errs: list[str],
+    fail_fast: bool = False,
+) -> list[int]:
     """
     Validates and parses specific spirits to save for opening Star Way.
     Any of the seven star spirits can be set, with the allowed values of
@@ -607,48 +806,35 @@ def _get_required_spirits(
     """
     parsed_required_spirits: list[int] = list()
 
-    new_wrns: list[str] = list()
-    new_errs: list[str] = list()
-
     if required_spirits is None:
-        return parsed_required_spirits, new_wrns, new_errs
-
-    allowed_values: dict[str | int, int] = {
-        "Eldstar": 1,
-        "Mamar": 2,
-        "Skolar": 3,
-        "Muskular": 4,
-        "Misstar": 5,
-        "Klevar": 6,
-        "Kalmar": 7,
-        1: 1,
-        2: 2,
-        3: 3,
-        4: 4,
-        5: 5,
-        6: 6,
-        7: 7,
-    }
+        return parsed_required_spirits
+
+    seen_spirits: set[int] = set()
 
     for k in required_spirits:
+        if fail_fast and new_errs:
+            return parsed_required_spirits
         # Check if value is unset
         if k is None:
             continue
 
         # Check datatypes for key
-        if not isinstance(k, str) and not isinstance(k, int):
-            new_errs.append(f"required_spirits: key has wrong data type (expected str or int): \"{k}\" ({type(k)})")
+        if not isinstance(k, str) and type(k) is not int:
+            new_errs.append(f"required_spirits: key has wrong data type (expected str or int): \"{k}\" ({type(k).__name__})")
             continue
 
         # Check if key is in allowed ranges
-        if k not in allowed_values:
-            new_errs.append(f"required_spirits: found unexpected key: \"{k}\" (not one of {allowed_values.keys()=})")
+        spirit = _ALLOWED_SPIRITS.get(k)
+        if spirit is None:
+            new_errs.append(f"required_spirits: found unexpected key: \"{k}\" (not one of allowed_values.keys()={_ALLOWED_SPIRITS_REPR})")
             continue
 
-        if allowed_values[k] in parsed_required_spirits:
-            new_wrns.append(f"required_spirits: spirit number \"{allowed_values[k]}\" set multiple times, ignoring")
+        if spirit in seen_spirits:
+            new_wrns.append(f"required_spirits: spirit number \"{spirit}\" set multiple times, ignoring")
         else:
-            parsed_required_spirits.append(allowed_values[k])
+            seen_spirits.add(spirit)
+
+    parsed_required_spirits = sorted(seen_spirits)
 
     if len(parsed_required_spirits) >= 7:
         new_wrns.append(f"required_spirits: all spirits required, this will turn off 'Require Specific Spirits'")
@@ -659,14 +845,15 @@ def _get_required_spirits(
             f"'Require Specific Spirits' is turned off"
         )
 
-    parsed_required_spirits.sort()
-
-    return parsed_required_spirits, new_wrns, new_errs
+    return parsed_required_spirits
 
 
 def _get_item_placement(
-    item_areas: dict[str, dict[str, str | None | dict[str, str | int | None]]] | None
-) -> tuple[list[int], list[str], list[str]]:
+    item_areas: dict[str, dict[str, str | None | dict[str, str | int | None]]] | None,
+    new_wrns: list[str],
+    new_errs: list[str],
+    fail_fast: bool = False,
+) -> dict[str, dict[str, str | dict[str, str | int]]]:
     """
     Validates and parses item placement.
     Item placement is subject to certain restrictions, which the seed generator
@@ -697,225 +884,30 @@ def _get_item_placement(
     are already placed or vice-versa, placing a SuperBlock outside of block
     locations.
     """
-    new_wrns: set[str] = set()
-    new_errs: list[str] = list()
-    parsed_item_placement: dict[str, dict[str, int | str]] = dict()
+    parsed_item_placement: dict[str, dict[str, str | dict[str, str | int]]] = dict()
 
     if item_areas is None:
-        return parsed_item_placement, list(new_wrns), new_errs
-
-    track_placed_items: dict[str, list] = dict()
-
-    def _try_placing_item(
-        ref_item_placement_dict: dict,
-        area_key: str,
-        item_location: str,
-        item_name: str,
-        shop_data_key: str | None = None,
-    ) -> tuple[list[str], list[str]]:
-        placement_wrns: list[str] = list()
-        placement_errs: list[str] = list()
-
-        placement_okay = True
-
-        # Check: Is item allowed to be placed here?
-        ## SuperBlocks cannot be placed outside of block locations
-        if (    item_name == "SuperBlock"
-            and (   area_key not in block_locations
-                 or item_location not in block_locations[area_key])
-        ):
-            placement_okay = False
-            placement_errs.append(
-                f"items: \"SuperBlock\" placed into location "
-                f"\"{area_key}: {item_location}\" but SuperBlocks can only be "
-                "placed into SuperBlock or MultiCoinBlock locations"
-            )
-
-        ## Item is trap and location cannot hold traps
-        if (    item_name.startswith("TRAP")
-            and (   (    area_key in shop_locations
-                     and item_location in shop_locations[area_key])
-                 or item_location in forbidden_trap_locations
-            )
-        ):
-            placement_okay = False
-            placement_errs.append(f"items: location \"{area_key}:{item_location}\" cannot hold traps")
-
-        ## Location is always out of logic, and is made to hold progression
-        if item_location in illogical_locations and item_name in progression_items:
-            placement_wrns.append(
-                f"items: progression item \"{item_name}\" placed into location "
-                f"that is always out of logic: \"{area_key}: {item_location}\". "
-                "This item will always count an unreachable!"
-            )
-
-        # Check: Specific trap item is a valid item
-        if item_name.startswith("TRAP") and item_name != "TRAP":
-            regex_match = re.match(r"TRAP \((.*)\)", item_name)
-            specific_trap = regex_match.group(1)
-            if specific_trap is None:
-                placement_okay = False
-                placement_errs.append(f"items: location \"{area_key}:{item_location}\" has trap set that's not recognized: \"{item_name}\"")
-            elif specific_trap not in allowed_items or specific_trap == "Coin":
-                placement_okay = False
-                placement_errs.append(f"items: location \"{area_key}:{item_location}\" has trap set that is not an allowed item: \"{item_name}\"")
-
-        # Check: Progressive badge families being placed manually
-        if item_name in progressive_badges["originals"]:
-            if any([x for x in progressive_badges["progressives"] if x in track_placed_items]):
-                placement_okay = False
-                placement_errs.append(f"items: cannot place both progressive and non-progressive badges")
-            else:
-                placement_wrns.append(f"items: badge \"{item_name}\" is manually set: This turns off Progressive Badges")
-        if item_name in progressive_badges["progressives"]:
-            if any([x for x in progressive_badges["originals"] if x in track_placed_items]):
-                placement_okay = False
-                placement_errs.append(f"items: cannot place both progressive and non-progressive badges")
-            else:
-                placement_wrns.append(f"items: badge \"{item_name}\" is manually set: This turns on Progressive Badges")
-
-        # Check: Partner Upgrade items and warn that they turn on their setting
-        if item_name.endswith("Upgrade"):
-            placement_wrns.append(f"items: placing partner upgrade will turn on Partner Upgrade Shuffle")
-
-        # Check: Random Block locations warnings
-        if (    area_key in block_locations
-            and item_location in block_locations[area_key]
-        ):
-            if "MultiCoinBlock" in item_location:
-                if item_name == "SuperBlock" or item_name.endswith("Upgrade"):
-                    placement_wrns.append(
-                        "items: placing a SuperBlock or Partner Upgrade item "
-                        "into a MultiCoinBlock location will set "
-                        "Multi Coin Block Shuffle to at least \"Shuffle\" and "
-                        "Partner Upgrade Shuffle to \"Shuffle\""
-                    )
-                elif item_name != "CoinBag":
-                    placement_wrns.append(
-                        "items: placing an item that is not a CoinBag, a "
-                        "SuperBlock, or a partner upgrade into a "
-                        "MultiCoinBlock location will set "
-                        "Multi Coin Block Shuffle to \"Anywhere\", and "
-                        "Partner Upgrade Shuffle to \"Full Shuffle\" "
-                    )
-            else: # "SuperBlock" in item_location
-                if item_name == "CoinBag":
-                    placement_wrns.append(
-                        "items: placing a CoinBag item into a SuperBlock "
-                        "location will set Partner Upgrade Shuffle to at least "
-                        "\"Shuffle\" and Multi Coin Block Shuffle to \"Shuffle\""
-                    )
-                elif item_name != "SuperBlock" and not item_name.endswith("Upgrade"):
-                    placement_wrns.append(
-                        "items: placing an item that is not a CoinBag, a "
-                        "SuperBlock, or a partner upgrade into a "
-                        "SuperBlock location will set "
-                        "Partner Upgrade Shuffle to \"Full Shuffle\", and "
-                        "Multi Coin Block Shuffle to \"Anywhere\""
-                    )
-
-        # Check: Did we already exceed the number of intances allowed for this item?
-        if item_name in limited_items and item_name in track_placed_items:
-            if track_placed_items[item_name] >= limited_items[item_name]:
-                placement_okay = False
-                placement_errs.append(f"items: \"{item_name}\" placed more often than allowed. max: {limited_items[item_name]}")
-
-            ## Check: If star pieces, check numbers for warning thresholds
-            if item_name == "StarPiece" and 34 < track_placed_items[item_name]:
-                placement_wrns.append("items: placed more than 34 star pieces: Depending on settings this can lead to weird vanilla star piece locations")
-
-        # Check: Magical Seeds and warn that they may modify the flower gate
-        # setting
-        if item_name.startswith("MagicalSeed"):
-            placement_wrns.append(
-                "items: placed one or more magical seeds: this may adjust your "
-                "settings for the number of seeds required to open the flower "
-                "gate."
-            )
-
-        # Check: Placing Star Beam
-        if item_name == "StarBeam":
-            placement_wrns.append(
-                "items: placed Star Beam item: this will force on the \"Shuffle Star Beam\" setting"
-            )
-
-        # Check: Does this item clash with another one already placed due to
-        # conflicting settings?
-        if (    item_name in mutually_exclusive_items
-            and any([
-                True for x in mutually_exclusive_items[item_name]
-                if x in track_placed_items
-            ])
-        ):
-            placement_okay = False
-            placement_errs.append(
-                f"items: attempting to place \"{item_name}\", but this clashes "\
-                f"with other, already placed items: {mutually_exclusive_items[item_name]}"
-            )
-
-        # Check: Are we placing a badge that would be sold by Rowf if shop
-        # shuffle was turned off?
-        if (item_name in rowf_badges):
-            placement_wrns.append(
-                "items: placed a badge that would usually appear in Rowf's shop. "\
-                "This will require Shop Shuffle to be turned on, or not generate "\
-                "a seed successfully."
-            )
-
-        # Check: Are we placing a badge that would be sold by Merlow if shop
-        # shuffle was turned off?
-        if (item_name in merlow_badges):
-            placement_wrns.append(
-                "items: placed a badge that would usually appear in Merlow's shop. "\
-                "This will require Shop Shuffle to be turned on, or not generate "\
-                "a seed successfully."
-            )
-
-        # Check: Is this item the 8th partner we place, in turn not leaving any
-        # partner to start the seed with?
-        if (   item_name in partner_items
-            and 7 == sum([track_placed_items.get(partner, 0) for partner in partner_items])
-        ):
-            placement_okay = False
-            placement_errs.append(f"items: attempting to place all 8 partners does not leave any partner to start the seed with")
-
-
-        if placement_okay:
-            if area_key not in ref_item_placement_dict:
-                ref_item_placement_dict[area_key] = dict()
-            if shop_data_key is None:
-                ref_item_placement_dict[area_key][item_location] = item_name
-                if item_name not in track_placed_items:
-                    track_placed_items[item_name] = 1
-                else:
-                    track_placed_items[item_name] += 1
-            else:
-                if item_location not in ref_item_placement_dict[area_key]:
-                    ref_item_placement_dict[area_key][item_location] = dict()
-                ref_item_placement_dict[area_key][item_location][shop_data_key] = item_name
-                if item_name not in track_placed_items:
-                    track_placed_items[item_name] = 1
-                else:
-                    track_placed_items[item_name] += 1
-
-        return placement_wrns, placement_errs
+        return parsed_item_placement
+
+    # Placement warnings repeat per placed item, so only emit each one once
+    seen_wrns: set[str] = set()
 
+    track_placed_items: Counter[str] = Counter()
 
     for area_key, v in item_areas.items():
+        if fail_fast and new_errs:
+            return parsed_item_placement
         # Check datatypes for top-level key and values
-        new_err_found = False
-        if not isinstance(area_key, str):
-            new_errs.append(f"items: key has wrong data type (expected str): \"{area_key}\" ({type(area_key)})")
-            new_err_found = True
-        if v is not None and not isinstance(v, dict):
-            new_errs.append(f"items: value has wrong data type (expected dict): \"{v}\" ({type(v)})")
-            new_err_found = True
-        if new_err_found:
+        if not (isinstance(area_key, str) and (v is None or isinstance(v, dict))):
+            if not isinstance(area_key, str):
+                new_errs.append(f"items: key has wrong data type (expected str): \"{area_key}\" ({type(area_key).__name__})")
+            if v is not None and not isinstance(v, dict):
+                new_errs.append(f"items: value has wrong data type (expected dict): \"{v}\" ({type(v).__name__})")
             continue
 
         # Check if key is an allowed area name
         if area_key not in allowed_locations:
-            new_wrns.add(f"items: found unexpected key: \"{area_key}\" (not one of {allowed_locations.keys()=})")
+            new_wrns.append(f"items: found unexpected key: \"{area_key}\" (not one of allowed_locations.keys()={_ALLOWED_AREAS_REPR})")
             continue
 
         # Check if value is unset
@@ -923,22 +915,24 @@ def _get_item_placement(
             continue
 
         for item_location, item_or_shopdict in v.items():
+            if fail_fast and new_errs:
+                return parsed_item_placement
             # Check datatypes for item location key and values
-            new_err_found = False
-            if not isinstance(item_location, str):
-                new_errs.append(f"items: item location has wrong data type (expected str): \"{item_location}\" ({type(item_location)})")
-                new_err_found = True
-            if (    item_or_shopdict is not None
-                and not isinstance(item_or_shopdict, (str, dict))
+            if not (    isinstance(item_location, str)
+                    and (   item_or_shopdict is None
+                         or isinstance(item_or_shopdict, (str, dict)))
             ):
-                new_errs.append(f"items: item has wrong data type (expected str, dict or null): \"{item_or_shopdict}\" ({type(item_or_shopdict)})")
-                new_err_found = True
-            if new_err_found:
+                if not isinstance(item_location, str):
+                    new_errs.append(f"items: item location has wrong data type (expected str): \"{item_location}\" ({type(item_location).__name__})")
+                if (    item_or_shopdict is not None
+                    and not isinstance(item_or_shopdict, (str, dict))
+                ):
+                    new_errs.append(f"items: item has wrong data type (expected str, dict or null): \"{item_or_shopdict}\" ({type(item_or_shopdict).__name__})")
                 continue
 
             # Check if item location key is an allowed item location
-            if item_location not in allowed_locations[area_key]:
-                new_wrns.add(f"items: found unexpected item location: \"{item_location}\" (not part of \"{area_key}\")")
+            if (area_key, item_location) not in _ALLOWED_LOCATION_PAIRS:
+                new_wrns.append(f"items: found unexpected item location: \"{item_location}\" (not part of \"{area_key}\")")
                 continue
 
             # Check if value is unset
@@ -946,32 +940,29 @@ def _get_item_placement(
                 continue
 
             # Check if location can be removed by settings
-            if (    area_key in ignored_locations_openstarway
-                and item_location in ignored_locations_openstarway[area_key]
+            if (    (area_key, item_location) in _IGNORED_OPENSTARWAY_PAIRS
                 and (   isinstance(item_or_shopdict, str)
                      or item_or_shopdict.get("item") is not None)
             ):
-                new_wrns.add(
+                new_wrns.append(
                     f"items: location \"{area_key}: {item_location}\" has item set, but may "\
                     "be ignored if the seed goal is set to \"Open Star Way\", as the location "
                     "may be inaccessible"
                 )
-            if (    area_key in ignored_locations_bc_shortened
-                and item_location in ignored_locations_bc_shortened[area_key]
+            if (    (area_key, item_location) in _IGNORED_BC_SHORTENED_PAIRS
                 and (   isinstance(item_or_shopdict, str)
                      or item_or_shopdict.get("item") is not None)
             ):
-                new_wrns.add(
+                new_wrns.append(
                     f"items: location \"{area_key}: {item_location}\" has item set, but may "\
                     "be ignored if Bowser's Castle is set to \"Shortened\", as the location "
                     "may be inaccessible"
                 )
-            if (    area_key in ignored_locations_bc_bossrush
-                and item_location in ignored_locations_bc_bossrush[area_key]
+            if (    (area_key, item_location) in _IGNORED_BC_BOSSRUSH_PAIRS
                 and (   isinstance(item_or_shopdict, str)
                      or item_or_shopdict.get("item") is not None)
             ):
-                new_wrns.add(
+                new_wrns.append(
                     f"items: location \"{area_key}: {item_location}\" has item set, but may "\
                     "be ignored if Bowser's Castle is set to \"Boss Rush\", as the location "
                     "may be inaccessible"
@@ -979,103 +970,306 @@ def _get_item_placement(
 
             # Check if item location is "Star Sanctuary - Gift of the Stars"
             if item_location == force_starbeam_shuffle_location:
-                new_wrns.add(
+                new_wrns.append(
                     f"items: placed item into the \"{force_starbeam_shuffle_location}\" location: "\
                     "This will force on the \"Shuffle Star Beam\" setting"
                 )
 
             if isinstance(item_or_shopdict, dict):
                 # Check if this location even is a shop
-                if not item_location in shop_locations[area_key]:
+                if (area_key, item_location) not in _SHOP_LOCATION_PAIRS:
                     new_errs.append(f"items: item location \"{item_location}\" is not a shop, but \"{item_or_shopdict}\" is a dict")
                     continue
                 # Check if someone tries setting the prices for Merlow
-                if (    area_key in disallowed_shop_locations
-                    and item_location in disallowed_shop_locations[area_key]
-                ):
+                if (area_key, item_location) in _PRICE_FORBIDDEN_PAIRS:
                     new_errs.append(f"items: item location \"{item_location}\" is not a shop you can set the item price for (should be str instead)")
                     continue
 
                 for key, val in item_or_shopdict.items():
-                    new_err_found = False
-                    if not isinstance(key, str):
-                        new_errs.append(f"items: shop-dict key has wrong data type (expected str): \"{key}\" ({type(key)})")
-                        new_err_found = True
-                    if val is not None and not isinstance(val, (str, int)):
-                        new_errs.append(f"items: shop-dict value has wrong data type (expected str, int or null): \"{val}\" ({type(val)})")
-                        new_err_found = True
-                    if new_err_found or val is None:
+                    if fail_fast and new_errs:
+                        return parsed_item_placement
+                    if not (    isinstance(key, str)
+                            and (   val is None
+                                 or isinstance(val, str)
+                                 or type(val) is int)
+                    ):
+                        if not isinstance(key, str):
+                            new_errs.append(f"items: shop-dict key has wrong data type (expected str): \"{key}\" ({type(key).__name__})")
+                        if val is not None and not isinstance(val, str) and type(val) is not int:
+                            new_errs.append(f"items: shop-dict value has wrong data type (expected str, int or null): \"{val}\" ({type(val).__name__})")
+                        continue
+                    if val is None:
                         continue
 
                     # Check if value is allowed for this key
                     if key not in ["item", "price"]:
-                        new_wrns.add(f"items: found unexpected key \"{key}\"in item location: \"{item_location}\" (not one of ['item','price'])")
+                        _append_unique(new_wrns, seen_wrns, f"items: found unexpected key \"{key}\"in item location: \"{item_location}\" (not one of ['item','price'])")
 
                     if key == "price":
-                        if not isinstance(val, int):
-                            new_errs.append(f"items: shop-price for \"{item_location}\" has wrong data type (expected int or null): \"{val}\" ({type(val)})")
+                        if type(val) is not int:
+                            new_errs.append(f"items: shop-price for \"{item_location}\" has wrong data type (expected int or null): \"{val}\" ({type(val).__name__})")
                             continue
                         if not 0 <= val <= 999:
                             new_errs.append(f"items: shop-price for \"{item_location}\" is outside of allowed range of 0-999: \"{val}\")")
                             continue
 
                         #+ Add item price here
-                        if area_key not in parsed_item_placement:
-                            parsed_item_placement[area_key] = dict()
-                        if item_location not in parsed_item_placement[area_key]:
-                            parsed_item_placement[area_key][item_location] = dict()
-                        parsed_item_placement[area_key][item_location][key] = val
+                        area_placement = parsed_item_placement.setdefault(area_key, dict())
+                        area_placement.setdefault(item_location, dict())[key] = val
 
                     else: # key == "item"
                         if not isinstance(val, str):
-                            new_errs.append(f"items: shop item for \"{item_location}\" has wrong data type (expected str or null): \"{val}\" ({type(val)})")
+                            new_errs.append(f"items: shop item for \"{item_location}\" has wrong data type (expected str or null): \"{val}\" ({type(val).__name__})")
                             continue
 
                         # Check if item can be set
-                        if val not in allowed_items and val not in allowed_placeholders and not val.startswith("TRAP ("):
+                        if val not in _ALLOWED_ITEMS and val not in _ALLOWED_PLACEHOLDERS and not val.startswith("TRAP ("):
                             new_errs.append(f"items: found unexpected item at \"{item_location}\": \"{val}\"")
                             continue
 
                         # Check if location is one of the Dry Dry Outpost code spots
-                        if item_location in force_puzzlerando_locations:
-                            new_wrns.add("items: item placed into Dry Dry Outpost shop code location: This may force on Random Puzzles")
+                        if item_location in _FORCE_PUZZLERANDO_LOCATIONS:
+                            _append_unique(new_wrns, seen_wrns, "items: item placed into Dry Dry Outpost shop code location: This may force on Random Puzzles")
 
                         # Special item placement checks
                         placement_wrns, placement_errs = _try_placing_item(
+                            track_placed_items,
                             parsed_item_placement,
                             area_key,
                             item_location,
                             val,
                             key,
                         )
-                        for wrn in placement_wrns:
-                            new_wrns.add(wrn)
+                        new_wrns.extend(sorted(placement_wrns - seen_wrns))
+                        seen_wrns |= placement_wrns
                         new_errs.extend(placement_errs)
 
             else: # has to be str
                 item_name = item_or_shopdict
                 # Check if item can be set
-                if item_name not in allowed_items and item_name not in allowed_placeholders and not item_name.startswith("TRAP ("):
+                if item_name not in _ALLOWED_ITEMS and item_name not in _ALLOWED_PLACEHOLDERS and not item_name.startswith("TRAP ("):
                     new_errs.append(f"items: found unexpected item at \"{item_location}\": \"{item_name}\"")
                     continue
 
                 # Special item placement checks
                 placement_wrns, placement_errs = _try_placing_item(
+                    track_placed_items,
                     parsed_item_placement,
                     area_key,
                     item_location,
                     item_name,
                 )
-                for wrn in placement_wrns:
-                    new_wrns.add(wrn)
+                new_wrns.extend(sorted(placement_wrns - seen_wrns))
+                seen_wrns |= placement_wrns
                 new_errs.extend(placement_errs)
 
-    return parsed_item_placement, list(new_wrns), new_errs
+    return parsed_item_placement
+
+
+def _try_placing_item(
+    track_placed_items: Counter[str],
+    ref_item_placement_dict: dict,
+    area_key: str,
+    item_location: str,
+    item_name: str,
+    shop_data_key: str | None = None,
+) -> tuple[set[str], list[str]]:
+    """
+    Runs the item specific placement checks for placing ``item_name`` into the
+    given location. If none of the checks fail, the item gets placed into
+    ``ref_item_placement_dict`` and counted in ``track_placed_items``.
+    Returns the warnings and errors caused by this placement.
+    """
+    placement_wrns: set[str] = set()
+    placement_errs: list[str] = list()
+
+    placement_okay = True
+    is_trap = item_name.startswith("TRAP")
+    is_partner_upgrade = item_name.endswith("Upgrade")
+
+    # Check: Is item allowed to be placed here?
+    ## SuperBlocks cannot be placed outside of block locations
+    if (    item_name == "SuperBlock"
+        and (area_key, item_location) not in _BLOCK_LOCATION_PAIRS
+    ):
+        placement_okay = False
+        placement_errs.append(
+            f"items: \"SuperBlock\" placed into location "
+            f"\"{area_key}: {item_location}\" but SuperBlocks can only be "
+            "placed into SuperBlock or MultiCoinBlock locations"
+        )
+
+    ## Item is trap and location cannot hold traps
+    if is_trap and (area_key, item_location) in _TRAP_FORBIDDEN_PAIRS:
+        placement_okay = False
+        placement_errs.append(f"items: location \"{area_key}:{item_location}\" cannot hold traps")
+
+    ## Location is always out of logic, and is made to hold progression
+    if item_location in _ILLOGICAL_LOCATIONS and item_name in _PROGRESSION_ITEMS:
+        placement_wrns.add(
+            f"items: progression item \"{item_name}\" placed into location "
+            f"that is always out of logic: \"{area_key}: {item_location}\". "
+            "This item will always count an unreachable!"
+        )
+
+    # Check: Specific trap item is a valid item
+    if is_trap and item_name != "TRAP":
+        trap_match = _TRAP_RE.match(item_name)
+        if trap_match is None:
+            placement_okay = False
+            placement_errs.append(f"items: location \"{area_key}:{item_location}\" has trap set that's not recognized: \"{item_name}\"")
+        elif trap_match.group(1) not in _ALLOWED_ITEMS or trap_match.group(1) == "Coin":
+            placement_okay = False
+            placement_errs.append(f"items: location \"{area_key}:{item_location}\" has trap set that is not an allowed item: \"{item_name}\"")
+
+    # Check: Progressive badge families being placed manually
+    if item_name in _ORIGINAL_BADGES:
+        if not track_placed_items.keys().isdisjoint(_PROGRESSIVE_BADGES):
+            placement_okay = False
+            placement_errs.append(f"items: cannot place both progressive and non-progressive badges")
+        else:
+            placement_wrns.add(f"items: badge \"{item_name}\" is manually set: This turns off Progressive Badges")
+    if item_name in _PROGRESSIVE_BADGES:
+        if not track_placed_items.keys().isdisjoint(_ORIGINAL_BADGES):
+            placement_okay = False
+            placement_errs.append(f"items: cannot place both progressive and non-progressive badges")
+        else:
+            placement_wrns.add(f"items: badge \"{item_name}\" is manually set: This turns on Progressive Badges")
+
+    # Check: Partner Upgrade items and warn that they turn on their setting
+    if is_partner_upgrade:
+        placement_wrns.add(f"items: placing partner upgrade will turn on Partner Upgrade Shuffle")
+
+    # Check: Random Block locations warnings
+    if (area_key, item_location) in _BLOCK_LOCATION_PAIRS:
+        if "MultiCoinBlock" in item_location:
+            if item_name == "SuperBlock" or is_partner_upgrade:
+                placement_wrns.add(
+                    "items: placing a SuperBlock or Partner Upgrade item "
+                    "into a MultiCoinBlock location will set "
+                    "Multi Coin Block Shuffle to at least \"Shuffle\" and "
+                    "Partner Upgrade Shuffle to \"Shuffle\""
+                )
+            elif item_name != "CoinBag":
+                placement_wrns.add(
+                    "items: placing an item that is not a CoinBag, a "
+                    "SuperBlock, or a partner upgrade into a "
+                    "MultiCoinBlock location will set "
+                    "Multi Coin Block Shuffle to \"Anywhere\", and "
+                    "Partner Upgrade Shuffle to \"Full Shuffle\" "
+                )
+        else: # "SuperBlock" in item_location
+            if item_name == "CoinBag":
+                placement_wrns.add(
+                    "items: placing a CoinBag item into a SuperBlock "
+                    "location will set Partner Upgrade Shuffle to at least "
+                    "\"Shuffle\" and Multi Coin Block Shuffle to \"Shuffle\""
+                )
+            elif item_name != "SuperBlock" and not is_partner_upgrade:
+                placement_wrns.add(
+                    "items: placing an item that is not a CoinBag, a "
+                    "SuperBlock, or a partner upgrade into a "
+                    "SuperBlock location will set "
+                    "Partner Upgrade Shuffle to \"Full Shuffle\", and "
+                    "Multi Coin Block Shuffle to \"Anywhere\""
+                )
+
+    # Check: Did we already exceed the number of intances allowed for this item?
+    if item_name in limited_items and item_name in track_placed_items:
+        if track_placed_items[item_name] >= limited_items[item_name]:
+            placement_okay = False
+            placement_errs.append(f"items: \"{item_name}\" placed more often than allowed. max: {limited_items[item_name]}")
+
+        ## Check: If star pieces, check numbers for warning thresholds
+        if item_name == "StarPiece" and 34 < track_placed_items[item_name]:
+            placement_wrns.add("items: placed more than 34 star pieces: Depending on settings this can lead to weird vanilla star piece locations")
+
+    # Check: Magical Seeds and warn that they may modify the flower gate
+    # setting
+    if item_name.startswith("MagicalSeed"):
+        placement_wrns.add(
+            "items: placed one or more magical seeds: this may adjust your "
+            "settings for the number of seeds required to open the flower "
+            "gate."
+        )
+
+    # Check: Placing Star Beam
+    if item_name == "StarBeam":
+        placement_wrns.add(
+            "items: placed Star Beam item: this will force on the \"Shuffle Star Beam\" setting"
+        )
+
+    # Check: Does this item clash with another one already placed due to
+    # conflicting settings?
+    if (    item_name in mutually_exclusive_items
+        and not track_placed_items.keys().isdisjoint(
+            mutually_exclusive_items[item_name]
+        )
+    ):
+        placement_okay = False
+        placement_errs.append(
+            f"items: attempting to place \"{item_name}\", but this clashes "\
+            f"with other, already placed items: {mutually_exclusive_items[item_name]}"
+        )
+
+    # Check: Are we placing a badge that would be sold by Rowf if shop
+    # shuffle was turned off?
+    if (item_name in _ROWF_BADGES):
+        placement_wrns.add(
+            "items: placed a badge that would usually appear in Rowf's shop. "\
+            "This will require Shop Shuffle to be turned on, or not generate "\
+            "a seed successfully."
+        )
+
+    # Check: Are we placing a badge that would be sold by Merlow if shop
+    # shuffle was turned off?
+    if (item_name in _MERLOW_BADGES):
+        placement_wrns.add(
+            "items: placed a badge that would usually appear in Merlow's shop. "\
+            "This will require Shop Shuffle to be turned on, or not generate "\
+            "a seed successfully."
+        )
+
+    # Check: Is this item the 8th partner we place, in turn not leaving any
+    # partner to start the seed with?
+    if (   item_name in _PARTNER_ITEMS
+        and 7 == sum(track_placed_items[partner] for partner in partner_items)
+    ):
+        placement_okay = False
+        placement_errs.append(f"items: attempting to place all 8 partners does not leave any partner to start the seed with")
+
+
+    if placement_okay:
+        area_placement = ref_item_placement_dict.setdefault(area_key, dict())
+        if shop_data_key is None:
+            area_placement[item_location] = item_name
+        else:
+            area_placement.setdefault(item_location, dict())[shop_data_key] = item_name
+        track_placed_items[item_name] += 1
+
+    return placement_wrns, placement_errs
+
+
+def _append_unique(
+    messages: list[str],
+    seen_messages: set[str],
+    message: str,
+) -> None:
+    """
+    Appends ``message`` to ``messages``, unless it is already part of
+    ``seen_messages``.
+    """
+    if message not in seen_messages:
+        seen_messages.add(message)
+        messages.append(message)
 
 
 def _get_dungeon_entrances(
-    dungeon_entrances: dict[str | str] | None
-) -> tuple[dict[int, int], list[str], list[str]]:
+    dungeon_entrances: dict[str | str] | None,
+    new_wrns: list[str],
+    new_errs: list[str],
+    fail_fast: bool = False,
+) -> dict[int, int]:
     """
     Validates and parses specific spirits to save for opening Star Way.
     Any of the seven star spirits can be set, with the allowed values of
@@ -1094,24 +1288,23 @@ def _get_dungeon_entrances(
     """
     parsed_dungeon_entrances: dict[int, int] = dict()
 
-    new_wrns: list[str] = list()
-    new_errs: list[str] = list()
-
     if dungeon_entrances is None:
-        return parsed_dungeon_entrances, new_wrns, new_errs
+        return parsed_dungeon_entrances
 
     allowed_keys = dungeon_entrance_locations
     allowed_values = dungeons
 
     for k, v in dungeon_entrances.items():
+        if fail_fast and new_errs:
+            return parsed_dungeon_entrances
         # Check datatypes for key
         if not isinstance(k, str):
-            new_errs.append(f"dungeon_entrances: key has wrong data type (expected str): \"{k}\" ({type(k)})")
+            new_errs.append(f"dungeon_entrances: key has wrong data type (expected str): \"{k}\" ({type(k).__name__})")
             continue
 
         # Check if key is in allowed ranges
         if k not in allowed_keys:
-            new_errs.append(f"dungeon_entrances: found unexpected key: \"{k}\" (not one of {allowed_keys=})")
+            new_errs.append(f"dungeon_entrances: found unexpected key: \"{k}\" (not one of allowed_keys={_DUNGEON_ENTRANCE_LOCATIONS_REPR})")
             continue
 
         # Check if value is unset
@@ -1120,12 +1313,12 @@ def _get_dungeon_entrances(
 
         # Check datatypes for value
         if not isinstance(v, str):
-            new_errs.append(f"dungeon_entrances: values has wrong data type (expected str): \"{v}\" ({type(v)})")
+            new_errs.append(f"dungeon_entrances: values has wrong data type (expected str): \"{v}\" ({type(v).__name__})")
             continue
 
         # Check if key is in allowed ranges
         if v not in allowed_values:
-            new_errs.append(f"dungeon_entrances: found unexpected value: \"{v}\" (not one of {allowed_values=})")
+            new_errs.append(f"dungeon_entrances: found unexpected value: \"{v}\" (not one of allowed_values={_DUNGEONS_REPR})")
             continue
 
         if dungeons.index(v) + 1 in parsed_dungeon_entrances.values():
@@ -1146,4 +1339,23 @@ def _get_dungeon_entrances(
         )
 
     print(parsed_dungeon_entrances)
-    return parsed_dungeon_entrances, new_wrns, new_errs
+    return parsed_dungeon_entrances
+
+
+# dict[toplevel_field, tuple[expected_type, type_label, parsing_function]]
+_TOPLEVEL_DISPATCH: dict[str, tuple[type, str, Callable]] = {
+    TOPLEVEL_FIELD_DIFFICULTY: (dict, "dict", _get_difficulty),
+    TOPLEVEL_FIELD_MOVE_COSTS: (dict, "dict", _get_move_costs),
+    TOPLEVEL_FIELD_BOSS_BATTLES: (dict, "dict", _get_boss_battles),
+    TOPLEVEL_FIELD_REQUIRED_SPIRITS: (list, "list", _get_required_spirits),
+    TOPLEVEL_FIELD_ITEMS: (dict, "dict", _get_item_placement),
+    TOPLEVEL_FIELD_DUNGEON_ENTRANCES: (dict, "dict", _get_dungeon_entrances),
+}
+
+
+# dict[move_type, parsing_function]
+_MOVE_COSTS_DISPATCH: dict[str, Callable] = {
+    "badge": _get_badge_costs,
+    "partner": _get_partner_costs,
+    "starpower": _get_starpower_costs,
+}